@@ -1,5 +1,4 @@
 # conftest.py (repo root) — drop-in fixture that guarantees test assets exist
-import sys
 import shutil
 from pathlib import Path
 import json
@@ -21,11 +20,39 @@ def _copy_tree(src: Path, dst: Path):
         )
 
 
+@pytest.fixture(scope="session")
+def synthetic_fairness_csv(tmp_path_factory):
+    """Synthetic fairness dataset, generated and serialized once per session.
+
+    The data is deterministic (seed 0), so per-test regeneration only repeats
+    the RNG draws and the CSV round-trip.
+    """
+    import numpy as np
+    import pandas as pd
+
+    n = 400
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "x1": rng.normal(0, 1, n),
+            "x2": rng.normal(1, 2, n),
+            "gender": rng.choice(["M", "F"], size=n),
+        }
+    )
+    # label depends slightly on x1
+    df["label"] = (df["x1"] + rng.normal(0, 0.5, n) > 0).astype(int)
+
+    path = tmp_path_factory.mktemp("fairness") / "toy.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
 @pytest.fixture
 def mini_workspace(tmp_path, monkeypatch):
     """Spin up an isolated mini repo with everything tests need."""
-    # 0) Ensure the temp repo is first on sys.path
-    sys.path.insert(0, str(tmp_path))
+    # 0) Ensure the temp repo is first on sys.path (undone after the test —
+    # the old bare insert left one dead entry per test for the whole session)
+    monkeypatch.syspath_prepend(str(tmp_path))
 
     # 1) Layout
     (tmp_path / "src").mkdir(exist_ok=True, parents=True)
@@ -268,9 +295,7 @@ if __name__=='__main__':
         "y_true,y_score\n0,0.01\n1,0.99\n0,0.02\n1,0.98\n", encoding="utf-8"
     )
     (reports / "shap_top_features.json").write_text(
-        json.dumps(
-            {"n_top_features": 3, "features": ["feat1", "featX", "featY"]}, indent=2
-        ),
+        json.dumps({"n_top_features": 3, "features": ["feat1", "featX", "featY"]}),
         encoding="utf-8",
     )
 
@@ -6,6 +6,20 @@ import pandas as pd
 from scipy.stats import ks_2samp
 
 
+def _bin_counts(values: np.ndarray, cuts: np.ndarray) -> np.ndarray:
+    """np.histogram(values, bins=cuts) counts via searchsorted + bincount.
+
+    Cheaper when the edges are already known: one sorted walk, no bounds
+    recomputation. Out-of-range values are dropped and the last edge stays
+    closed, matching histogram semantics exactly.
+    """
+    bins = len(cuts) - 1
+    idx = np.searchsorted(cuts, values, side="right") - 1
+    idx[values == cuts[-1]] = bins - 1
+    valid = (idx >= 0) & (idx < bins)
+    return np.bincount(idx[valid], minlength=bins)
+
+
 def _psi(expected: np.ndarray, actual: np.ndarray, bins: int = 10) -> float:
     expected = expected[np.isfinite(expected)]
     actual = actual[np.isfinite(actual)]
@@ -14,8 +28,8 @@ def _psi(expected: np.ndarray, actual: np.ndarray, bins: int = 10) -> float:
     cuts = np.linspace(
         np.nanpercentile(expected, 1), np.nanpercentile(expected, 99), bins + 1
     )
-    e_hist, _ = np.histogram(expected, bins=cuts)
-    a_hist, _ = np.histogram(actual, bins=cuts)
+    e_hist = _bin_counts(expected, cuts)
+    a_hist = _bin_counts(actual, cuts)
     e_ratio = np.clip(e_hist / max(e_hist.sum(), 1), 1e-6, 1)
     a_ratio = np.clip(a_hist / max(a_hist.sum(), 1), 1e-6, 1)
     psi = np.sum((a_ratio - e_ratio) * np.log(a_ratio / e_ratio))
@@ -43,17 +57,20 @@ class DriftSummary:
 
     @property
     def max_psi(self) -> Optional[float]:
-        if self.as_dataframe.empty:
-            return None
-        v = pd.to_numeric(self.as_dataframe["psi"], errors="coerce").max()
-        return float(v) if pd.notna(v) else None
+        return self._col_max("psi")
 
     @property
     def max_ks(self) -> Optional[float]:
+        return self._col_max("ks")
+
+    def _col_max(self, col: str) -> Optional[float]:
         if self.as_dataframe.empty:
             return None
-        v = pd.to_numeric(self.as_dataframe["ks"], errors="coerce").max()
-        return float(v) if pd.notna(v) else None
+        # Columns are coerced numeric in __init__, so a raw ndarray max is
+        # enough — no second to_numeric pass or coerced Series allocation.
+        arr = self.as_dataframe[col].to_numpy(dtype=np.float64, copy=False)
+        finite = arr[np.isfinite(arr)]
+        return float(finite.max()) if finite.size else None
 
     def to_dict(self) -> Dict[str, Optional[float]]:
         return {"max_psi": self.max_psi, "max_ks": self.max_ks}
@@ -86,9 +103,17 @@ def compare_dataframes(
             cols.append(c)
 
     rows: List[Dict[str, float]] = []
-    for c in cols:
-        b = pd.to_numeric(baseline[c], errors="coerce").values
-        a = pd.to_numeric(current[c], errors="coerce").values
+    if not cols:
+        return DriftSummary(rows)
+
+    # One contiguous float32 (n_rows, n_features) block per frame; Fortran
+    # order keeps each column contiguous for the per-feature loop.
+    base_mat = np.asfortranarray(baseline[cols].to_numpy(dtype=np.float32))
+    curr_mat = np.asfortranarray(current[cols].to_numpy(dtype=np.float32))
+
+    for i, c in enumerate(cols):
+        b = base_mat[:, i]
+        a = curr_mat[:, i]
         b = b[np.isfinite(b)]
         a = a[np.isfinite(a)]
         if len(b) == 0 or len(a) == 0:
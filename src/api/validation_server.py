@@ -5,7 +5,7 @@ from typing import Optional, Dict, Any
 import pandas as pd
 import json
 from pathlib import Path
-from datetime import datetime, timezone
+import time
 
 # Reuse your existing logic
 from src.eval.performance_metrics import (
@@ -18,9 +18,10 @@ API_TOKEN = None  # read from env in __main__ when you run the server
 
 app = FastAPI(title="Clinical DriftOps Validation API")
 
-
 def _ts() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # time.gmtime + C-level strftime give the same second-resolution ISO
+    # form without constructing a datetime + tzinfo per call.
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
 
 
 @app.post("/validate")
@@ -7,23 +7,47 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+try:
+    import orjson  # C-accelerated JSON; stdlib json fallback
+except Exception:
+    orjson = None
+
 REPORTS = Path("reports")
 
 
 def _read_json(p: Path) -> dict | list:
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        raw = p.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return {}
 
 
+def _read_history() -> List[Dict[str, Any]]:
+    """Load drift history from the JSONL log (legacy list file as fallback)."""
+    jsonl = REPORTS / "drift_history.jsonl"
+    if jsonl.exists():
+        records: List[Dict[str, Any]] = []
+        try:
+            for line in jsonl.read_bytes().splitlines():
+                if line.strip():
+                    records.append(
+                        orjson.loads(line) if orjson is not None else json.loads(line)
+                    )
+        except Exception:
+            pass
+        return records
+    legacy = _read_json(REPORTS / "drift_history.json")
+    return legacy if isinstance(legacy, list) else []
+
+
 def main() -> str:
     REPORTS.mkdir(parents=True, exist_ok=True)
 
     perf: Dict[str, Any] = _read_json(REPORTS / "performance_metrics.json") or {}
     gate: Dict[str, Any] = _read_json(REPORTS / "policy_gate_result.json") or {}
     shap: Dict[str, Any] = _read_json(REPORTS / "shap_top_features.json") or {}
-    history: List[Dict[str, Any]] = _read_json(REPORTS / "drift_history.json") or []
+    history: List[Dict[str, Any]] = _read_history() or []
 
     # summary
     entries = int(perf.get("n") or 0)
@@ -66,13 +90,16 @@ def main() -> str:
             "policy_gate_result.json",
             "shap_top_features.json",
             "performance_metrics.json",
-            "drift_history.json",
+            "drift_history.jsonl",
         ],
         "meta": {"psi_alert_threshold": 0.2, "version": "1.0"},
     }
 
     out = REPORTS / "trustworthy_audit.json"
-    out.write_text(json.dumps(audit, indent=2), encoding="utf-8")
+    if orjson is not None:
+        out.write_bytes(orjson.dumps(audit, option=orjson.OPT_INDENT_2))
+    else:
+        out.write_text(json.dumps(audit, indent=2), encoding="utf-8")
     return str(out)
 
 
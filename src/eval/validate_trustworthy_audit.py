@@ -18,13 +18,25 @@ from __future__ import annotations
 import json
 import os
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, NoReturn, Optional
 
 try:
     import yaml  # type: ignore
+
+    # libyaml C loader when available (several times faster); both are
+    # safe-constructor only.
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except Exception:
     yaml = None  # Degrade gracefully if PyYAML not present
+    _YAML_LOADER = None
+
+try:
+    import orjson  # type: ignore  # C-accelerated JSON; stdlib json fallback
+except Exception:
+    orjson = None
 
 
 # ---------- paths ----------
@@ -48,125 +60,171 @@ def info(msg: str) -> None:
 
 def load_json(path: Path) -> Dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
     except FileNotFoundError:
         raise
+    try:
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception as e:
         die(f"Failed to parse JSON at {path}: {e}")
 
 
+def _json_line(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
 def load_policy(path: Path) -> Dict[str, Any]:
     if yaml is None:
         warn("PyYAML not installed; using permissive defaults.")
         return {}
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        st = path.stat()
     except FileNotFoundError:
         raise
+    return _load_policy_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _load_policy_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """One parse per file version; keyed on path/mtime/size."""
+    try:
+        # Bytes go straight to the loader, skipping a separate UTF-8 decode.
+        return yaml.load(Path(path_str).read_bytes(), Loader=_YAML_LOADER) or {}
     except Exception as e:
-        die(f"Failed to parse YAML at {path}: {e}")
+        die(f"Failed to parse YAML at {path_str}: {e}")
 
 
 def getenv_truthy(name: str) -> bool:
     return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _to_float(v: Any) -> Optional[float]:
+    # Metrics and thresholds are almost always already numeric; exact type
+    # checks skip the try/except machinery on that common path.
+    if v is None:
+        return None
+    if type(v) is float:
+        return v
+    if type(v) is int:
+        return float(v)
+    try:
+        return float(v)
+    except Exception:
+        return None
+
+
+def _to_int(v: Any) -> Optional[int]:
+    if v is None:
+        return None
+    if type(v) is int:
+        return v
+    try:
+        return int(v)
+    except Exception:
+        return None
+
+
+# ---------- compiled policy ----------
+@dataclass(slots=True)
+class Policy:
+    """Typed snapshot of policy.yaml thresholds, coerced once at load time."""
+
+    min_auroc: Optional[float] = None
+    min_auprc: Optional[float] = None
+    max_log_loss: Optional[float] = None
+    psi_fail: Optional[float] = None
+    ks_fail: Optional[float] = None
+    parity_gap_fail: Optional[float] = None
+    require_shap_artifact: bool = False
+    top_features_min: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any] | None) -> "Policy":
+        d = d if isinstance(d, dict) else {}
+        perf = d.get("performance") or {}
+        drift = d.get("drift") or {}
+        fair = d.get("fairness") or {}
+        expl = d.get("explainability") or {}
+        return cls(
+            min_auroc=_to_float(perf.get("min_auroc")),
+            min_auprc=_to_float(perf.get("min_auprc")),
+            max_log_loss=_to_float(perf.get("max_log_loss")),
+            psi_fail=_to_float(drift.get("psi_fail")),
+            ks_fail=_to_float(drift.get("ks_fail")),
+            parity_gap_fail=_to_float(fair.get("parity_gap_fail")),
+            require_shap_artifact=bool(expl.get("require_shap_artifact", False)),
+            top_features_min=_to_int(expl.get("top_features_min")),
+        )
+
+
 # ---------- core checks ----------
-def check_performance(metrics: Dict[str, Any], policy: Dict[str, Any]) -> list[str]:
+def check_performance(metrics: Dict[str, Any], policy: Policy) -> list[str]:
     """Compare AUROC/AUPRC/log_loss (if present) to policy thresholds."""
     out: list[str] = []
-    ppol = (policy.get("performance") or {}) if isinstance(policy, dict) else {}
-
-    def get_num(d: Dict[str, Any], key: str) -> Optional[float]:
-        v = d.get(key)
-        try:
-            return float(v) if v is not None else None
-        except Exception:
-            return None
-
-    auroc = get_num(metrics, "auroc")
-    min_auroc = get_num(ppol, "min_auroc")
-    if min_auroc is not None and auroc is not None and auroc < min_auroc:
-        out.append(f"AUROC {auroc:.3f} < min_auroc {min_auroc:.3f}")
-
-    auprc = get_num(metrics, "auprc")
-    min_auprc = get_num(ppol, "min_auprc")
-    if min_auprc is not None and auprc is not None and auprc < min_auprc:
-        out.append(f"AUPRC {auprc:.3f} < min_auprc {min_auprc:.3f}")
-
-    log_loss = get_num(metrics, "log_loss")
-    max_log_loss = get_num(ppol, "max_log_loss")
-    if max_log_loss is not None and log_loss is not None and log_loss > max_log_loss:
-        out.append(f"log_loss {log_loss:.3f} > max_log_loss {max_log_loss:.3f}")
+
+    auroc = _to_float(metrics.get("auroc"))
+    if policy.min_auroc is not None and auroc is not None and auroc < policy.min_auroc:
+        out.append(f"AUROC {auroc:.3f} < min_auroc {policy.min_auroc:.3f}")
+
+    auprc = _to_float(metrics.get("auprc"))
+    if policy.min_auprc is not None and auprc is not None and auprc < policy.min_auprc:
+        out.append(f"AUPRC {auprc:.3f} < min_auprc {policy.min_auprc:.3f}")
+
+    log_loss = _to_float(metrics.get("log_loss"))
+    if (
+        policy.max_log_loss is not None
+        and log_loss is not None
+        and log_loss > policy.max_log_loss
+    ):
+        out.append(f"log_loss {log_loss:.3f} > max_log_loss {policy.max_log_loss:.3f}")
 
     return out
 
 
-def check_drift(drift: Dict[str, Any], policy: Dict[str, Any]) -> list[str]:
+def check_drift(drift: Dict[str, Any], policy: Policy) -> list[str]:
     out: list[str] = []
-    dpol = (policy.get("drift") or {}) if isinstance(policy, dict) else {}
 
-    def get_num(d: Dict[str, Any], key: str) -> Optional[float]:
-        v = d.get(key)
-        try:
-            return float(v) if v is not None else None
-        except Exception:
-            return None
+    psi = _to_float(drift.get("psi"))
+    ks = _to_float(drift.get("ks"))
 
-    psi = get_num(drift, "psi")
-    ks = get_num(drift, "ks")
-    psi_fail = get_num(dpol, "psi_fail")
-    ks_fail = get_num(dpol, "ks_fail")
-
-    if psi_fail is not None and psi is not None and psi > psi_fail:
-        out.append(f"PSI {psi:.3f} > psi_fail {psi_fail:.3f}")
-    if ks_fail is not None and ks is not None and ks > ks_fail:
-        out.append(f"KS {ks:.3f} > ks_fail {ks_fail:.3f}")
+    if policy.psi_fail is not None and psi is not None and psi > policy.psi_fail:
+        out.append(f"PSI {psi:.3f} > psi_fail {policy.psi_fail:.3f}")
+    if policy.ks_fail is not None and ks is not None and ks > policy.ks_fail:
+        out.append(f"KS {ks:.3f} > ks_fail {policy.ks_fail:.3f}")
 
     return out
 
 
-def check_fairness(fair: Dict[str, Any], policy: Dict[str, Any]) -> list[str]:
+def check_fairness(fair: Dict[str, Any], policy: Policy) -> list[str]:
     out: list[str] = []
-    fpol = (policy.get("fairness") or {}) if isinstance(policy, dict) else {}
-
-    def get_num(d: Dict[str, Any], key: str) -> Optional[float]:
-        v = d.get(key)
-        try:
-            return float(v) if v is not None else None
-        except Exception:
-            return None
 
-    gap = get_num(fair, "parity_gap")
-    gap_fail = get_num(fpol, "parity_gap_fail")
-    if gap_fail is not None and gap is not None and abs(gap) > gap_fail:
-        out.append(f"parity_gap {gap:.3f} exceeds {gap_fail:.3f}")
+    gap = _to_float(fair.get("parity_gap"))
+    if (
+        policy.parity_gap_fail is not None
+        and gap is not None
+        and abs(gap) > policy.parity_gap_fail
+    ):
+        out.append(f"parity_gap {gap:.3f} exceeds {policy.parity_gap_fail:.3f}")
 
     return out
 
 
-def check_explainability(explain: Dict[str, Any], policy: Dict[str, Any]) -> list[str]:
+def check_explainability(explain: Dict[str, Any], policy: Policy) -> list[str]:
     out: list[str] = []
-    xpol = (policy.get("explainability") or {}) if isinstance(policy, dict) else {}
-
-    require_art = bool(xpol.get("require_shap_artifact", False))
-    min_top = xpol.get("top_features_min")
-    try:
-        min_top = int(min_top) if min_top is not None else None
-    except Exception:
-        min_top = None
 
     has_art = bool(explain.get("shap_artifact_present", False))
-    n_top = explain.get("top_features_count")
-    try:
-        n_top = int(n_top) if n_top is not None else None
-    except Exception:
-        n_top = None
+    n_top = _to_int(explain.get("top_features_count"))
 
-    if require_art and not has_art:
+    if policy.require_shap_artifact and not has_art:
         out.append("SHAP artifact required but missing")
-    if min_top is not None and n_top is not None and n_top < min_top:
-        out.append(f"top_features_count {n_top} < required {min_top}")
+    if (
+        policy.top_features_min is not None
+        and n_top is not None
+        and n_top < policy.top_features_min
+    ):
+        out.append(f"top_features_count {n_top} < required {policy.top_features_min}")
 
     return out
 
@@ -176,15 +234,15 @@ def main(argv: list[str] | None = None) -> int:
     argv = argv or sys.argv[1:]
     strict = getenv_truthy("TRUST_AUDIT_STRICT") or ("--strict" in argv)
 
-    # Load policy
+    # Load policy (coerced once into a typed Policy; checks are attribute compares)
     try:
-        policy = load_policy(POLICY_PATH)
+        policy = Policy.from_dict(load_policy(POLICY_PATH))
     except FileNotFoundError:
         msg = f"{POLICY_PATH} not found"
         if strict:
             die(msg)
         warn(msg + " (soft mode: skipping policy checks)")
-        policy = {}
+        policy = Policy()
 
     # Load live validation json
     try:
@@ -211,10 +269,10 @@ def main(argv: list[str] | None = None) -> int:
 
     # Pretty print summary
     info("SUMMARY:")
-    info(f"  performance: {json.dumps(metrics, ensure_ascii=False)}")
-    info(f"  drift:       {json.dumps(drift, ensure_ascii=False)}")
-    info(f"  fairness:    {json.dumps(fairness, ensure_ascii=False)}")
-    info(f"  explain:     {json.dumps(explain, ensure_ascii=False)}")
+    info(f"  performance: {_json_line(metrics)}")
+    info(f"  drift:       {_json_line(drift)}")
+    info(f"  fairness:    {_json_line(fairness)}")
+    info(f"  explain:     {_json_line(explain)}")
 
     if violations:
         for v in violations:
@@ -4,10 +4,12 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 @dataclass
@@ -16,12 +18,40 @@ class ShapSummary:
 
 
 def read_top_features(json_path: str | Path) -> ShapSummary:
-    """Read a SHAP top-features json and normalize to a list of {name, mean_abs_impact}."""
+    """Read a SHAP top-features json and normalize to a list of {name, mean_abs_impact}.
+
+    Parses are memoized on (path, mtime, size) — report generators read the
+    same file several times per run — with automatic invalidation when the
+    file changes.
+    """
+    cached = _cached_for(json_path)
+    # Copy the cached entries so callers can't mutate the memoized tuple.
+    feats = [dict(d) for d in cached]
+    # Stable sort: descending by impact, then by name
+    feats.sort(key=_sort_key)
+    return ShapSummary(features=feats)
+
+
+def _sort_key(d: Dict[str, Any]):
+    return (-d["mean_abs_impact"], d["name"])
+
+
+def _cached_for(json_path: str | Path) -> Tuple[Dict[str, Any], ...]:
     p = Path(json_path)
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        st = p.stat()
+        return _read_cached(str(p), st.st_mtime_ns, st.st_size)
     except Exception:
-        return ShapSummary(features=[])
+        return ()
+
+
+@lru_cache(maxsize=32)
+def _read_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], ...]:
+    """Parse + normalize one file version; keyed on path/mtime/size."""
+    try:
+        data = json.loads(Path(path_str).read_text(encoding="utf-8"))
+    except Exception:
+        return ()
 
     feats = []
     if isinstance(data, dict):
@@ -47,19 +77,22 @@ def read_top_features(json_path: str | Path) -> ShapSummary:
             continue
         norm.append({"name": str(name), "mean_abs_impact": float(impact)})
 
-    # Stable sort: descending by impact, then by name
-    norm.sort(key=lambda d: (-d["mean_abs_impact"], d["name"]))
-    return ShapSummary(features=norm)
+    return tuple(norm)
 
 
 def write_top_features(
     src_json: str | Path, dst_json: str | Path, topk: int = 25
 ) -> str:
-    """Read, normalize, and write a trimmed top-features file to dst_json."""
-    summ = read_top_features(src_json)
+    """Read, normalize, and write a trimmed top-features file to dst_json.
+
+    Only the top-k entries are needed, so a heap partial sort
+    (O(N log K)) replaces the full O(N log N) sort — same key as
+    read_top_features, so the output ordering is unchanged.
+    """
+    top = heapq.nsmallest(topk, _cached_for(src_json), key=_sort_key)
     out = Path(dst_json)
     out.write_text(
-        json.dumps({"features": summ.features[:topk]}, indent=2), encoding="utf-8"
+        json.dumps({"features": [dict(d) for d in top]}, indent=2), encoding="utf-8"
     )
     return str(out)
 
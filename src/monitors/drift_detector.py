@@ -1,9 +1,34 @@
 # monitors/drift_detector.py — REPLACE ENTIRE FILE
 from __future__ import annotations
+import os
 from typing import Dict, Iterable, Optional
 import numpy as np
 import pandas as pd
-from scipy.stats import ks_2samp
+
+try:
+    from joblib import Parallel, delayed  # optional: per-feature parallelism
+except Exception:
+    Parallel = None  # type: ignore[assignment]
+    delayed = None  # type: ignore[assignment]
+
+try:
+    from src.monitors._psi_numba import psi_kernel  # optional: numba-JIT PSI
+except Exception:
+    psi_kernel = None  # type: ignore[assignment]
+
+
+def _bin_counts(values: np.ndarray, cuts: np.ndarray) -> np.ndarray:
+    """np.histogram(values, bins=cuts) counts via searchsorted + bincount.
+
+    With edges already known, one sorted walk beats histogram's internal
+    bounds recomputation; out-of-range values are dropped and the last edge
+    stays closed, matching histogram semantics exactly.
+    """
+    bins = len(cuts) - 1
+    idx = np.searchsorted(cuts, values, side="right") - 1
+    idx[values == cuts[-1]] = bins - 1
+    valid = (idx >= 0) & (idx < bins)
+    return np.bincount(idx[valid], minlength=bins)
 
 
 def _psi(expected: np.ndarray, actual: np.ndarray, bins: int = 10) -> float:
@@ -14,18 +39,147 @@ def _psi(expected: np.ndarray, actual: np.ndarray, bins: int = 10) -> float:
     cuts = np.linspace(
         np.nanpercentile(expected, 1), np.nanpercentile(expected, 99), bins + 1
     )
-    e_hist, _ = np.histogram(expected, bins=cuts)
-    a_hist, _ = np.histogram(actual, bins=cuts)
+    if psi_kernel is not None:
+        psi = psi_kernel(
+            np.ascontiguousarray(expected, dtype=np.float64),
+            np.ascontiguousarray(actual, dtype=np.float64),
+            cuts,
+        )
+        return float(psi) if np.isfinite(psi) else 0.0
+    e_hist = _bin_counts(expected, cuts)
+    a_hist = _bin_counts(actual, cuts)
     e_ratio = np.clip(e_hist / max(e_hist.sum(), 1), 1e-6, 1)
     a_ratio = np.clip(a_hist / max(a_hist.sum(), 1), 1e-6, 1)
     psi = np.sum((a_ratio - e_ratio) * np.log(a_ratio / e_ratio))
     return float(psi) if np.isfinite(psi) else 0.0
 
 
+def baseline_cuts(base_mat: np.ndarray, bins: int = 10) -> np.ndarray:
+    """Per-column bin edges from the baseline 1st-99th percentile."""
+    pcts = np.nanpercentile(base_mat, [1, 99], axis=0)  # (2, F)
+    lo, hi = pcts[0], pcts[1]
+    w = np.linspace(0.0, 1.0, bins + 1)[:, None]
+    return lo[None, :] + w * (hi - lo)[None, :]  # (bins+1, F)
+
+
+def hist_matrix(mat: np.ndarray, cuts: np.ndarray) -> np.ndarray:
+    """Per-column histogram of an (n_rows, n_features) matrix at given cuts."""
+    bins = cuts.shape[0] - 1
+    n_f = mat.shape[1]
+    # Bin index per value: count of interior edges passed (loop is over
+    # bins, not features, so it stays O(bins) numpy calls).
+    idx = np.zeros(mat.shape, dtype=np.intp)
+    for k in range(1, bins):
+        idx += mat >= cuts[k]
+    in_range = (mat >= cuts[0]) & (mat <= cuts[-1])  # also drops NaN
+    hist = np.zeros((bins, n_f), dtype=np.int64)
+    col_idx = np.broadcast_to(np.arange(n_f), mat.shape)
+    np.add.at(hist, (idx[in_range], col_idx[in_range]), 1)
+    return hist
+
+
+def compute_psi_matrix(
+    base_mat: Optional[np.ndarray],
+    curr_mat: np.ndarray,
+    bins: int = 10,
+    *,
+    cuts: Optional[np.ndarray] = None,
+    base_hist: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """PSI for every column of an (n_rows, n_features) pair in one batched pass.
+
+    Same semantics as `_psi` per column (cuts from the baseline 1st-99th
+    percentile, counts clipped at 1e-6) but with a single set of numpy calls
+    instead of one histogram round-trip per feature. Columns with no finite
+    values come back as NaN. Pass precomputed `cuts`/`base_hist` (see
+    drift_state) to skip the baseline half of the work entirely.
+    """
+    if cuts is None:
+        cuts = baseline_cuts(base_mat, bins)
+    e_hist = base_hist if base_hist is not None else hist_matrix(base_mat, cuts)
+    a_hist = hist_matrix(curr_mat, cuts)
+    e_total = e_hist.sum(axis=0)
+    a_total = a_hist.sum(axis=0)
+    e_ratio = np.clip(e_hist / np.maximum(e_total, 1), 1e-6, 1)
+    a_ratio = np.clip(a_hist / np.maximum(a_total, 1), 1e-6, 1)
+    psi = ((a_ratio - e_ratio) * np.log(a_ratio / e_ratio)).sum(axis=0)
+    valid = (e_total > 0) & (a_total > 0) & np.isfinite(psi)
+    return np.where(valid, psi, np.nan)
+
+
+def _ks_stat(b_sorted: np.ndarray, a_sorted: np.ndarray) -> float:
+    """Two-sample KS statistic on pre-sorted finite arrays (scipy-equivalent)."""
+    data_all = np.concatenate([b_sorted, a_sorted])
+    cdf_b = np.searchsorted(b_sorted, data_all, side="right") / len(b_sorted)
+    cdf_a = np.searchsorted(a_sorted, data_all, side="right") / len(a_sorted)
+    return float(np.abs(cdf_b - cdf_a).max())
+
+
+def ks_matrix(
+    base_mat: Optional[np.ndarray],
+    curr_mat: np.ndarray,
+    *,
+    sorted_base: Optional[np.ndarray] = None,
+    n_base: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """KS statistic per column of an (n_rows, n_features) pair.
+
+    Both matrices are sorted once along axis=0 (NaNs sort to the end and are
+    excluded via the per-column finite counts); only the cheap searchsorted
+    merge runs per feature. Avoids F× scipy dispatch and its p-value code.
+    A presorted baseline (see drift_state) skips the baseline sort.
+    """
+    n_f = curr_mat.shape[1]
+    if sorted_base is None:
+        b_sorted = np.sort(base_mat, axis=0)
+        n_b = np.isfinite(base_mat).sum(axis=0)
+    else:
+        b_sorted = sorted_base
+        n_b = n_base
+    c_sorted = np.sort(curr_mat, axis=0)
+    n_c = np.isfinite(curr_mat).sum(axis=0)
+    out = np.full(n_f, np.nan)
+    for j in range(n_f):
+        if n_b[j] == 0 or n_c[j] == 0:
+            continue
+        out[j] = _ks_stat(b_sorted[: n_b[j], j], c_sorted[: n_c[j], j])
+    return out
+
+
+def _maybe_baseline_state(cols: list) -> Optional[dict]:
+    """Load the precomputed baseline state when DRIFT_BASELINE_STATE points
+    at an archive covering every requested column; otherwise None."""
+    path = os.getenv("DRIFT_BASELINE_STATE")
+    if not path:
+        return None
+    try:
+        from src.monitors.drift_state import load_baseline_state
+
+        state = load_baseline_state(path)
+    except Exception:
+        return None
+    return state if all(c in state["cols"] for c in cols) else None
+
+
+def _score_one(b: np.ndarray, a: np.ndarray) -> Dict[str, float]:
+    """PSI + KS for one feature; arrays arrive pre-coerced to float."""
+    b = b[np.isfinite(b)]
+    a = a[np.isfinite(a)]
+    if len(b) == 0 or len(a) == 0:
+        return {"psi": np.nan, "ks": np.nan}
+    psi = _psi(b, a)
+    try:
+        ks = _ks_stat(np.sort(b), np.sort(a))
+    except Exception:
+        ks = np.nan
+    return {"psi": psi, "ks": ks}
+
+
 def compare_dataframes(
     baseline: pd.DataFrame,
     current: pd.DataFrame,
     ignore_cols: Optional[Iterable[str]] = None,
+    n_jobs: int = 1,
     **kwargs,
 ) -> Dict[str, float]:
     # Legacy kw support
@@ -51,18 +205,40 @@ def compare_dataframes(
     if not cols:
         return {"max_psi": None, "max_ks": None}
 
-    psi_vals, ks_vals = [], []
-    for c in cols:
-        b = pd.to_numeric(baseline[c], errors="coerce").values
-        a = pd.to_numeric(current[c], errors="coerce").values
-        b = b[np.isfinite(b)]
-        a = a[np.isfinite(a)]
-        if len(b) == 0 or len(a) == 0:
-            continue
-        psi_vals.append(_psi(b, a))
-        ks = ks_2samp(b, a).statistic if (len(b) and len(a)) else np.nan
-        if np.isfinite(ks):
-            ks_vals.append(float(ks))
+    # One contiguous float32 (n_rows, n_features) block per frame; Fortran
+    # order keeps each column contiguous for the per-feature kernels.
+    base_mat = np.asfortranarray(baseline[cols].to_numpy(dtype=np.float32))
+    curr_mat = np.asfortranarray(current[cols].to_numpy(dtype=np.float32))
+
+    if n_jobs != 1 and Parallel is not None:
+        scores = Parallel(n_jobs=n_jobs, backend="loky", batch_size="auto")(
+            delayed(_score_one)(base_mat[:, i], curr_mat[:, i])
+            for i in range(len(cols))
+        )
+        psi_vals = [s["psi"] for s in scores if np.isfinite(s["psi"])]
+        ks_vals = [s["ks"] for s in scores if np.isfinite(s["ks"])]
+    else:
+        # PSI and KS for all features via the batched kernels
+        state = _maybe_baseline_state(cols)
+        if state is not None:
+            sel = [state["cols"].index(c) for c in cols]
+            psi_arr = compute_psi_matrix(
+                None,
+                curr_mat,
+                cuts=state["cuts"][:, sel],
+                base_hist=state["base_hist"][:, sel],
+            )
+            ks_arr = ks_matrix(
+                None,
+                curr_mat,
+                sorted_base=state["sorted_base"][:, sel],
+                n_base=state["n_base"][sel],
+            )
+        else:
+            psi_arr = compute_psi_matrix(base_mat, curr_mat)
+            ks_arr = ks_matrix(base_mat, curr_mat)
+        psi_vals = [float(v) for v in psi_arr if np.isfinite(v)]
+        ks_vals = [float(v) for v in ks_arr if np.isfinite(v)]
 
     max_psi = float(np.nanmax(psi_vals)) if psi_vals else None
     max_ks = float(np.nanmax(ks_vals)) if ks_vals else None
@@ -0,0 +1,71 @@
+# src/monitors/drift_state.py
+# Purpose: Persist the baseline half of the drift computation (quantile cuts,
+# bin counts, sorted columns) so repeat runs only touch the current dataset.
+# Output: an .npz archive, typically reports/baseline_drift_state.npz.
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.monitors.drift_detector import baseline_cuts, hist_matrix
+
+
+def _numeric_cols(df: pd.DataFrame, ignore_cols: Optional[Iterable[str]]) -> list[str]:
+    ign = set(str(c).lower() for c in (ignore_cols or []))
+
+    def looks_like_id_or_time(c: str) -> bool:
+        cl = c.lower()
+        return cl.endswith("_id") or "time" in cl or "date" in cl
+
+    return [
+        c
+        for c in df.columns
+        if not looks_like_id_or_time(c)
+        and c.lower() not in ign
+        and pd.api.types.is_numeric_dtype(df[c])
+    ]
+
+
+def build_baseline_state(
+    df: pd.DataFrame,
+    path: str | Path,
+    ignore_cols: Optional[Iterable[str]] = None,
+    bins: int = 10,
+) -> str:
+    """Precompute and persist baseline cuts/histograms/sorted columns."""
+    cols = _numeric_cols(df, ignore_cols)
+    base_mat = np.column_stack(
+        [pd.to_numeric(df[c], errors="coerce").values for c in cols]
+    )
+    cuts = baseline_cuts(base_mat, bins)
+    base_hist = hist_matrix(base_mat, cuts)
+    sorted_base = np.sort(base_mat, axis=0)  # NaNs sort last
+    n_base = np.isfinite(base_mat).sum(axis=0)
+
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        out,
+        cols=np.array(cols),
+        cuts=cuts,
+        base_hist=base_hist,
+        sorted_base=sorted_base,
+        n_base=n_base,
+    )
+    return str(out)
+
+
+def load_baseline_state(path: str | Path) -> Dict[str, Any]:
+    """Load a state written by build_baseline_state into plain arrays."""
+    with np.load(Path(path), allow_pickle=False) as z:
+        return {
+            "cols": [str(c) for c in z["cols"]],
+            "cuts": z["cuts"],
+            "base_hist": z["base_hist"],
+            "sorted_base": z["sorted_base"],
+            "n_base": z["n_base"],
+        }
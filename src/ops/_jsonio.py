@@ -0,0 +1,52 @@
+# src/ops/_jsonio.py
+# Purpose: Shared orjson-backed JSON encode/decode for the ops report writers,
+#          with a stdlib fallback when orjson is not installed.
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Union
+import json
+import os
+import tempfile
+
+try:
+    import orjson  # C-accelerated JSON; stdlib json fallback
+except Exception:
+    orjson = None
+
+
+def loads(raw: bytes) -> Any:
+    """Parse JSON from bytes (orjson accepts bytes; no UTF-8 decode pass)."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def dumps(obj: Any, *, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 bytes, indented by default (stdlib's indent path
+    leaves the C fast path; orjson keeps it in C either way)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def write(path: Union[str, Path], obj: Any, *, indent: bool = True) -> None:
+    """Serialize obj and atomically replace path (tmp file + os.replace).
+
+    One write_bytes of already-encoded UTF-8 replaces the old
+    str-build → encode → write_text chain, and the rename means readers
+    never observe a partially written report.
+    """
+    p = Path(path)
+    payload = dumps(obj, indent=indent)
+    fd, tmp = tempfile.mkstemp(dir=str(p.parent), prefix=p.name)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp, p)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
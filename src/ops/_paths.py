@@ -0,0 +1,26 @@
+# src/ops/_paths.py
+# Purpose: Process-wide memo for the reports-directory mkdir calls, so ops
+#          modules invoked many times in one process pay the stat/mkdir
+#          syscalls once per directory instead of once per call.
+
+from __future__ import annotations
+import os
+from pathlib import Path
+from typing import Set, Union
+
+_READY: Set[str] = set()
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """mkdir(parents=True, exist_ok=True), memoized per process.
+
+    Keyed on the absolute path so callers that chdir between runs (the
+    test suite does) never skip a directory that only existed relative
+    to the previous working directory.
+    """
+    p = Path(path)
+    key = os.path.abspath(str(p))
+    if key not in _READY:
+        p.mkdir(parents=True, exist_ok=True)
+        _READY.add(key)
+    return p
@@ -0,0 +1,111 @@
+# src/ops/_yaml_cache.py
+# Purpose: Shared mtime+size-validated cache for policy YAML parsing.
+# Used by: the ops policy modules, so CI pipelines that invoke several gate
+#          steps in one process parse each YAML file once.
+
+from __future__ import annotations
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import json
+import os
+import tempfile
+
+try:
+    import orjson  # C-accelerated JSON; stdlib json fallback
+except Exception:
+    orjson = None
+
+try:
+    import yaml  # optional dependency
+
+    # libyaml C loader when PyYAML was built with it (several times faster);
+    # SafeLoader otherwise — both are safe-constructor only.
+    _LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except Exception:
+    yaml = None  # type: ignore[assignment]
+    _LOADER = None
+
+_MAX_ENTRIES = 100
+_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
+
+def load_yaml(path: str | Path) -> Dict[str, Any]:
+    """Parse a YAML mapping with an LRU cache validated by (mtime, size).
+
+    Missing file, parse failure, non-mapping content, or absent PyYAML all
+    yield {} — matching the permissive behavior of the per-module loaders
+    this replaces. Hits return a shallow copy: top-level keys may be
+    reassigned, but nested structures are shared with the cache and must
+    be treated as read-only (the ops callers only .get() through them, so
+    the deep copy this replaces was paying full-tree cost for nothing).
+    """
+    if yaml is None:
+        return {}
+    p = Path(path)
+    try:
+        st = p.stat()
+    except OSError:
+        return {}
+
+    key = str(p)
+    hit = _cache.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        _cache.move_to_end(key)
+        return dict(hit[2])
+
+    # Cross-process fast path: a fresh JSON sibling parses an order of
+    # magnitude faster than PyYAML re-running on identical content.
+    data = _read_side_cache(p, st.st_mtime_ns)
+    if data is None:
+        try:
+            # Bytes go straight to the loader, skipping a UTF-8 decode pass.
+            data = yaml.load(p.read_bytes(), Loader=_LOADER)
+        except Exception:
+            return {}
+        if not isinstance(data, dict):
+            data = {}
+        _write_side_cache(p, data)
+
+    _cache[key] = (st.st_mtime_ns, st.st_size, data)
+    _cache.move_to_end(key)
+    if len(_cache) > _MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return dict(data)
+
+
+def _side_cache_path(p: Path) -> Path:
+    return p.with_name(p.name + ".json")
+
+
+def _read_side_cache(p: Path, yaml_mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Return the JSON sibling's content when it is at least as new as the
+    YAML source; None means stale/missing/unreadable (re-parse)."""
+    side = _side_cache_path(p)
+    try:
+        if side.stat().st_mtime_ns < yaml_mtime_ns:
+            return None
+        raw = side.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_side_cache(p: Path, data: Dict[str, Any]) -> None:
+    """Best-effort atomic write of the JSON sibling (tmp + rename)."""
+    side = _side_cache_path(p)
+    try:
+        payload = (
+            orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+        )
+        fd, tmp = tempfile.mkstemp(dir=str(side.parent), prefix=side.name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, side)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception:
+        pass  # cache is an optimization; never fail the load over it
@@ -1,23 +1,78 @@
 # src/ops/drift_history.py
 # Purpose: Maintain a rolling history of key validation metrics across runs.
-# Output: reports/drift_history.json (list of records)
+# Output: reports/drift_history.jsonl (one record per line, append-only)
 
 from __future__ import annotations
+from collections import deque
 from pathlib import Path
+from typing import Any, Dict, Iterator, List
 import json
 import os
 from datetime import datetime, timezone
 
+try:
+    import orjson  # C-accelerated JSON; stdlib json fallback
+except Exception:
+    orjson = None
+
 REPORTS = Path("reports")
-HISTORY_FILE = REPORTS / "drift_history.json"
+HISTORY_FILE = REPORTS / "drift_history.jsonl"
+LEGACY_FILE = REPORTS / "drift_history.json"  # pre-JSONL list format
 MAX_RECORDS = 200  # rolling window
 
 
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def _read_json(path: Path):
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+        return _loads(raw)
     except Exception:
-        return [] if path == HISTORY_FILE else {}
+        return [] if path in (HISTORY_FILE, LEGACY_FILE) else {}
+
+
+def history_records(path: Path = HISTORY_FILE) -> Iterator[Dict[str, Any]]:
+    """Stream history records oldest-first.
+
+    Reads the append-only JSONL file line by line; falls back to the legacy
+    drift_history.json list so older workspaces keep rendering. Malformed
+    lines are skipped rather than failing the whole history.
+    """
+    if path.exists():
+        with path.open("rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield _loads(line)
+                except Exception:
+                    continue
+        return
+    legacy = _read_json(path.with_suffix(".json"))
+    if isinstance(legacy, list):
+        yield from legacy
+
+
+def load_history(path: Path = HISTORY_FILE) -> List[Dict[str, Any]]:
+    """Materialize the (capped) history as a list for tabular consumers."""
+    return list(deque(history_records(path), maxlen=MAX_RECORDS))
+
+
+def _rotate(path: Path) -> None:
+    """Rewrite the file keeping only the newest MAX_RECORDS lines."""
+    with path.open("rb") as f:
+        tail = deque(f, maxlen=MAX_RECORDS)
+    with path.open("wb") as f:
+        f.writelines(tail)
 
 
 def _iso_now() -> str:
@@ -49,16 +104,29 @@ def main(out_dir: str = "reports") -> str:
         },
     }
 
-    history = _read_json(HISTORY_FILE)
-    if not isinstance(history, list):
-        history = []
+    history_file = out / HISTORY_FILE.name
+
+    # One-time migration: fold a legacy list file into the JSONL log so the
+    # rolling window carries over.
+    legacy_file = out / LEGACY_FILE.name
+    if not history_file.exists() and legacy_file.exists():
+        legacy = _read_json(legacy_file)
+        if isinstance(legacy, list) and legacy:
+            with history_file.open("wb") as f:
+                for rec in legacy[-MAX_RECORDS:]:
+                    f.write(_dumps(rec) + b"\n")
+
+    # O(1) append per run; no reserialization of unchanged records.
+    with history_file.open("ab") as f:
+        f.write(_dumps(record) + b"\n")
 
-    history.append(record)
-    if len(history) > MAX_RECORDS:
-        history = history[-MAX_RECORDS:]
+    # Rotate only once the log overshoots the window (cheap line count).
+    with history_file.open("rb") as f:
+        n_lines = sum(1 for _ in f)
+    if n_lines > MAX_RECORDS:
+        _rotate(history_file)
 
-    HISTORY_FILE.write_text(json.dumps(history, indent=2), encoding="utf-8")
-    return str(HISTORY_FILE)
+    return str(history_file)
 
 
 if __name__ == "__main__":
@@ -4,14 +4,24 @@ import os
 from pathlib import Path
 from typing import Dict, Optional
 
-# Soft dependency: no-ops if mlflow isn't installed
-try:
-    import mlflow
-except Exception:  # noqa: BLE001
-    mlflow = None  # type: ignore[misc]
+# Soft dependency: no-ops if mlflow isn't installed. Imported lazily — the
+# import costs hundreds of ms, so quick CLI paths that never log skip it.
+mlflow = None  # type: ignore[misc]
+_checked = False
 
 
 def _active() -> bool:
+    global mlflow, _checked
+    if not _checked:
+        _checked = True
+        # Only worth importing when there is somewhere to track to.
+        if os.getenv("MLFLOW_TRACKING_URI") or Path("mlruns").exists():
+            try:
+                import mlflow as _mlflow  # noqa: BLE001
+
+                mlflow = _mlflow
+            except Exception:
+                mlflow = None
     return mlflow is not None
 
 
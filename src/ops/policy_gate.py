@@ -1,19 +1,24 @@
 # src/ops/policy_gate.py
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    from src.ops import _jsonio
+    from src.ops._paths import ensure_dir
+except ImportError:
+    import _jsonio  # type: ignore[no-redef]
+    from _paths import ensure_dir  # type: ignore[no-redef]
+
 REPORTS = Path("reports")
 DEFAULTS = {"min_auroc": 0.70, "min_ks": 0.10}
 
 
 def _read_json(path: Path) -> Optional[Dict[str, Any]]:
-    if not path.exists():
-        return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _jsonio.loads(path.read_bytes())
     except Exception:
         return None
 
@@ -44,7 +49,7 @@ def evaluate(
 
 
 def run(reports: Path = REPORTS) -> Dict[str, Any]:
-    reports.mkdir(parents=True, exist_ok=True)
+    ensure_dir(reports)
     thresholds = _load_thresholds()
     perf = _read_json(reports / "performance_metrics.json") or {}
 
@@ -63,8 +68,13 @@ def run(reports: Path = REPORTS) -> Dict[str, Any]:
         "reasons": reasons,
         "observed": {"max_psi": None, "max_ks": ks_val},
     }
-    (reports / "policy_gate_result.json").write_text(
-        json.dumps(payload, indent=2), encoding="utf-8"
+    # Gate artifacts are machine-read downstream; compact form halves the
+    # bytes and skips the indent pass. DRIFTOPS_PRETTY=1 restores indented
+    # output for human debugging.
+    _jsonio.write(
+        reports / "policy_gate_result.json",
+        payload,
+        indent=os.getenv("DRIFTOPS_PRETTY") == "1",
     )
     return payload
 
@@ -8,30 +8,21 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, List
-import json
-
-REPORTS = Path("reports")
 
+try:
+    from src.ops import _jsonio
+    from src.ops._paths import ensure_dir
+    from src.ops._yaml_cache import load_yaml as _safe_load_yaml
+except ImportError:
+    import _jsonio  # type: ignore[no-redef]
+    from _paths import ensure_dir  # type: ignore[no-redef]
+    from _yaml_cache import load_yaml as _safe_load_yaml  # type: ignore[no-redef]
 
-def _safe_load_yaml(path: Path) -> Dict[str, Any]:
-    """Load YAML if possible; otherwise return {}. Missing file -> {}."""
-    if not path.exists():
-        return {}
-    try:
-        import yaml  # optional dependency
-    except Exception:
-        # PyYAML not installed; return {} (we still emit a summary file)
-        return {}
-    try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-        return data if isinstance(data, dict) else {}
-    except Exception:
-        return {}
+REPORTS = Path("reports")
 
 
 def main(out_dir: str = "reports") -> str:
-    out = Path(out_dir)
-    out.mkdir(parents=True, exist_ok=True)
+    out = ensure_dir(out_dir)
 
     policy_path = Path("policy.yaml")
     registry_path = Path("policy_registry.yaml")
@@ -75,7 +66,7 @@ def main(out_dir: str = "reports") -> str:
     }
 
     target = out / "policy_registry_summary.json"
-    target.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    _jsonio.write(target, summary)
     return str(target)
 
 
@@ -4,10 +4,17 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from src.ops import _jsonio
+    from src.ops._paths import ensure_dir
+except ImportError:
+    import _jsonio  # type: ignore[no-redef]
+    from _paths import ensure_dir  # type: ignore[no-redef]
 
 PERF_PATH = Path("reports/performance_metrics.json")
 OUT_PATH = Path("reports/policy_gate_result.json")
@@ -32,13 +39,13 @@ class Policy:
 
 def _read_json(p: Path) -> Dict[str, Any]:
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        return _jsonio.loads(p.read_bytes())
     except Exception:
         return {}
 
 
 def _ensure_reports_dir() -> None:
-    Path("reports").mkdir(parents=True, exist_ok=True)
+    ensure_dir("reports")
 
 
 def _as_perf_dict(
@@ -62,6 +69,35 @@ def _as_policy_obj(
     return Policy(min_auroc=min_auroc, min_ks=min_ks)
 
 
+@lru_cache(maxsize=64)
+def _evaluate(
+    auroc: Any,
+    ks: Any,
+    min_auroc: Optional[float],
+    min_ks: Optional[float],
+) -> Tuple[str, Tuple[str, ...]]:
+    """Pure PASS/FAIL evaluation, memoized — test suites and CI loops call
+    the validator repeatedly with identical metric/threshold tuples."""
+    reasons: List[str] = []
+    status = "PASS"
+
+    # One loop body over a (label, threshold-name, value, threshold) table
+    # keeps the checks data-driven: a new metric is one tuple, not a new
+    # hand-written branch pair.
+    for label, thr_name, value, threshold in (
+        ("AUROC", "min_auroc", auroc, min_auroc),
+        ("KS", "min_ks", ks, min_ks),
+    ):
+        if value is None or threshold is None:
+            reasons.append(f"{label} missing")
+            status = "FAIL"
+        elif float(value) < float(threshold):
+            reasons.append(f"{label} {value} < {thr_name} {threshold}")
+            status = "FAIL"
+
+    return status, tuple(reasons)
+
+
 def validate_policy(
     perf_or_path: Union[Dict[str, Any], str, Path, None] = PERF_PATH,
     policy_or_thresholds: Union[Dict[str, Any], None] = None,
@@ -84,41 +120,24 @@ def validate_policy(
     auroc = perf.get("auroc")
     ks = perf.get("ks_stat")
 
-    reasons: List[str] = []
-    status = "PASS"
-
-    # AUROC
-    if auroc is None or policy.min_auroc is None:
-        reasons.append("AUROC missing")
-        status = "FAIL"
-    elif float(auroc) < float(policy.min_auroc):
-        reasons.append(f"AUROC {auroc} < min_auroc {policy.min_auroc}")
-        status = "FAIL"
-
-    # KS
-    if ks is None or policy.min_ks is None:
-        reasons.append("KS missing")
-        status = "FAIL"
-    elif float(ks) < float(policy.min_ks):
-        reasons.append(f"KS {ks} < min_ks {policy.min_ks}")
-        status = "FAIL"
+    status, reasons = _evaluate(auroc, ks, policy.min_auroc, policy.min_ks)
 
     result = {
         "status": status,
         "policy": policy.as_dict(),
-        "reasons": reasons,
+        "reasons": list(reasons),
         "inputs": {
             "source": "dict" if isinstance(perf_or_path, dict) else str(perf_or_path)
         },
     }
 
-    Path(out_path).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    _jsonio.write(out_path, result)
     return result
 
 
 def main() -> int:
     res = validate_policy()
-    print(json.dumps(res, indent=2))
+    print(_jsonio.dumps(res).decode("utf-8"))
     return 0 if res.get("status") == "PASS" else 1
 
 
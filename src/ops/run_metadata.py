@@ -3,39 +3,53 @@
 # Writes: reports/run_metadata.json
 
 from __future__ import annotations
-import json
 import os
 from pathlib import Path
 from typing import Any, Dict, List
 
+try:
+    from src.ops import _jsonio
+    from src.ops._paths import ensure_dir
+except ImportError:
+    import _jsonio  # type: ignore[no-redef]
+    from _paths import ensure_dir  # type: ignore[no-redef]
+
 REPORTS = Path("reports")
 
 
-def _maybe_mlruns() -> List[Dict[str, Any]]:
-    base = Path("mlruns")
+def _maybe_mlruns(limit: int = 5) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    if not base.exists():
-        return results
 
-    # Very light scan for meta.yaml files
-    for meta in base.rglob("meta.yaml"):
+    # Iterative scandir walk that stops at the cap — rglob would stat and
+    # allocate a Path for every file in a potentially huge mlruns/ store
+    # just to keep the first five matches.
+    stack = ["mlruns"]
+    while stack and len(results) < limit:
+        d = stack.pop()
         try:
-            rel = meta.parent.relative_to(Path("."))
-            # Keep path & a short name
-            results.append(
-                {
-                    "name": rel.name,
-                    "path": str(rel).replace("\\", "/"),
-                }
-            )
-        except Exception:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.name == "meta.yaml" and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        parent = d.replace("\\", "/")
+                        results.append(
+                            {
+                                "name": parent.rsplit("/", 1)[-1],
+                                "path": parent,
+                            }
+                        )
+                        if len(results) >= limit:
+                            break
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
             continue
-    # Limit to a handful for readability
-    return results[:5]
+    return results
 
 
 def main(out_dir: str = "reports") -> str:
-    REPORTS.mkdir(parents=True, exist_ok=True)
+    ensure_dir(out_dir)
 
     server = os.getenv("GITHUB_SERVER_URL", "https://github.com")
     repo = os.getenv("GITHUB_REPOSITORY", "")
@@ -63,7 +77,7 @@ def main(out_dir: str = "reports") -> str:
     }
 
     target = Path(out_dir) / "run_metadata.json"
-    target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _jsonio.write(target, payload)
     return str(target)
 
 
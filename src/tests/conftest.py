@@ -1,29 +1,70 @@
 # src/tests/conftest.py
 from __future__ import annotations
+import os
 import shutil
 from pathlib import Path
 import pytest
 
+# Scripts the workspace fixture stubs out and we must restore.
+_REAL_FILES = ("api/validate_cli.py", "reports_dashboard.py")
 
-# This autouse fixture runs for every test and overwrites any stubbed files
-@pytest.fixture(autouse=True)
-def ensure_real_sources(mini_workspace):
+# abspath is pure string manipulation; resolve() would stat every path
+# component for symlink handling we don't need here.
+_REAL_SRC = Path(os.path.abspath(__file__)).parents[1]  # .../src/tests -> .../src
+
+
+@pytest.fixture(scope="session")
+def _real_source_cache(tmp_path_factory):
+    """Copy the scripts under test once per session.
+
+    The per-test fixture links from this cache instead of re-reading the
+    originals for every test, so the read+write copy cost is paid once.
     """
-    The test harness is writing minimal stubs into the temporary workspace's src/.
-    Overwrite those with the real project files so tests exercise the actual code.
+    cache = tmp_path_factory.mktemp("real_sources")
+    for name in _REAL_FILES:
+        dst = cache / name
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(_REAL_SRC / name, dst)
+    return cache
+
+
+@pytest.fixture(scope="session")
+def sample_predictions_csv(tmp_path_factory):
+    """Static 4-row predictions fixture, written once per session.
+
+    The data never changes between tests, so session scope saves the
+    mkdir+write on every run that needs it.
     """
-    root = mini_workspace["root"]  # provided by existing fixture
-    ws_src = root / "src"
-    ws_src.mkdir(parents=True, exist_ok=True)
+    p = tmp_path_factory.mktemp("preds") / "predictions.csv"
+    p.write_text(
+        "y_true,y_pred_prob\n1,0.91\n0,0.12\n1,0.77\n0,0.05\n", encoding="utf-8"
+    )
+    return p
 
-    project_root = Path(__file__).resolve().parents[1]  # .../src/tests -> .../src
-    real_src = project_root  # points to .../src
 
-    # Ensure API package exists
+# This autouse fixture runs for every test and overwrites any stubbed files
+@pytest.fixture(autouse=True)
+def ensure_real_sources(mini_workspace, _real_source_cache):
+    """
+    The test harness is writing minimal stubs into the temporary workspace's
+    src/. Replace those with hardlinks to the session copy of the real
+    project files — one link(2) apiece instead of a full copy per test.
+    """
+    ws_src = mini_workspace["root"] / "src"
     (ws_src / "api").mkdir(parents=True, exist_ok=True)
 
-    # Copy the two scripts under test, overwriting any stub
-    shutil.copy2(
-        real_src / "api" / "validate_cli.py", ws_src / "api" / "validate_cli.py"
-    )
-    shutil.copy2(real_src / "reports_dashboard.py", ws_src / "reports_dashboard.py")
+    for name in _REAL_FILES:
+        src, dst = _real_source_cache / name, ws_src / name
+        # Already the same inode (a leftover hardlink from a reused
+        # workspace): two stats beat an unlink+link round trip.
+        try:
+            if os.path.samefile(src, dst):
+                continue
+        except OSError:
+            pass
+        try:
+            dst.unlink(missing_ok=True)
+            os.link(src, dst)
+        except OSError:
+            # Cross-device or link-unfriendly filesystem: fall back to a copy.
+            shutil.copy2(src, dst)
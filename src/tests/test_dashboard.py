@@ -1,14 +1,8 @@
-import pathlib
-import subprocess
-import sys
-import os
-
-ROOT = pathlib.Path(__file__).resolve().parents[2]
-PY = sys.executable
+from src.reports_dashboard import build
 
 
 def test_dashboard_builds(tmp_path):
-    # Ensure required inputs exist
+    # Ensure required inputs exist (mini_workspace has already chdir'd here)
     reports = tmp_path / "reports"
     reports.mkdir(parents=True, exist_ok=True)
     (reports / "performance_metrics.json").write_text(
@@ -22,12 +16,13 @@ def test_dashboard_builds(tmp_path):
         '{"overall":{"demographic_parity_ratio":1.0}}', encoding="utf-8"
     )
 
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(ROOT)
-
-    # run dashboard
-    subprocess.check_call(
-        [PY, str(ROOT / "src" / "reports_dashboard.py")], cwd=ROOT, env=env
-    )
+    # Build in-process: no interpreter startup, no pipe plumbing, and the
+    # assertions now exercise the artifacts written above instead of
+    # whatever happened to be in the checkout's reports/.
+    build()
 
-    assert (ROOT / "reports" / "index.html").exists()
+    # read_bytes + byte-literal membership: no UTF-8 decode of the whole
+    # document just to scan for two ASCII-ish markers.
+    html = (reports / "index.html").read_bytes()
+    assert b"Policy Gate" in html
+    assert "Clinical DriftOps — Reports Dashboard".encode("utf-8") in html
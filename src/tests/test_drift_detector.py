@@ -4,21 +4,29 @@ from monitors.drift_detector import compare_dataframes
 
 
 def test_psi_ks_detects_shift():
+    # A 0.5-sigma mean shift is detectable well below n=1000; the previous
+    # 10_000-row frames only made the RNG, binning and KS sort 10x slower.
+    # One standard_normal block plus affine transforms replaces four
+    # separate rng.normal passes; float32 is what the detector uses anyway.
     rng = np.random.default_rng(42)
+    z = rng.standard_normal((2, 2, 1_000), dtype=np.float32)
     base = pd.DataFrame(
         {
-            "x": rng.normal(0, 1, 10_000),
-            "y": rng.normal(5, 2, 10_000),
+            "x": z[0, 0],
+            "y": z[0, 1] * 2 + 5,
         }
     )
     curr = pd.DataFrame(
         {
-            "x": rng.normal(0.5, 1.2, 10_000),  # mean & std shift
-            "y": rng.normal(5, 2, 10_000),  # stable
+            "x": z[1, 0] * 1.2 + 0.5,  # mean & std shift
+            "y": z[1, 1] * 2 + 5,  # stable
         }
     )
     summary = compare_dataframes(base, curr, id_cols=())
     df = summary.as_dataframe.set_index("feature")
 
     assert df.loc["x", "drift_flag"] is True
-    assert df.loc["y", "drift_flag"] in (False, True)  # allow chance fluctuation
+    # The shifted feature's scores are well clear of noise at this n/seed
+    # (a sharper check than the old "y may be anything" assertion).
+    assert df.loc["x", "psi"] > 0.05
+    assert df.loc["x", "ks"] > 0.1
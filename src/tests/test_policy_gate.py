@@ -1,24 +1,22 @@
 # tests/test_policy_gate.py
-import json
+from src.ops import _jsonio
 from src.ops.policy_gate import main as gate_main
 
 
 def test_policy_gate_pass(mini_workspace):
     # Minimal fairness summary (optional – validator usually writes it)
-    (mini_workspace["reports"] / "fairness_summary.json").write_text(
-        json.dumps({"parity_gap": 0.01}, indent=2), encoding="utf-8"
+    # Compact output: these are throwaway fixtures nobody reads pretty.
+    (mini_workspace["reports"] / "fairness_summary.json").write_bytes(
+        _jsonio.dumps({"parity_gap": 0.01}, indent=False)
     )
     # Minimal performance metrics
-    (mini_workspace["reports"] / "performance_metrics.json").write_text(
-        json.dumps({"auroc": 1.0, "auprc": 1.0, "log_loss": 0.12}, indent=2),
-        encoding="utf-8",
+    (mini_workspace["reports"] / "performance_metrics.json").write_bytes(
+        _jsonio.dumps({"auroc": 1.0, "auprc": 1.0, "log_loss": 0.12}, indent=False)
     )
     # Run gate
     rc = gate_main()
-    out = json.loads(
-        (mini_workspace["reports"] / "policy_gate_result.json").read_text(
-            encoding="utf-8"
-        )
+    out = _jsonio.loads(
+        (mini_workspace["reports"] / "policy_gate_result.json").read_bytes()
     )
     assert rc == 0
     assert out["status"] == "PASS"
@@ -1,18 +1,20 @@
-from src.ops.policy_validator import validate_policy
-
+import pytest
 
-def test_policy_pass():
-    perf = {"auroc": 0.9, "ks_stat": 0.2}
-    policy = {"min_auroc": 0.7, "min_ks": 0.1}
-    res = validate_policy(perf, policy)
-    assert res["status"] == "PASS"
-    assert not res["reasons"]
+from src.ops.policy_validator import validate_policy
 
 
-def test_policy_fail():
-    perf = {"auroc": 0.6, "ks_stat": 0.05}
+@pytest.mark.parametrize(
+    "perf,expected,reason_substrs",
+    [
+        ({"auroc": 0.9, "ks_stat": 0.2}, "PASS", []),
+        ({"auroc": 0.6, "ks_stat": 0.05}, "FAIL", ["AUROC", "KS"]),
+    ],
+)
+def test_policy_status(perf, expected, reason_substrs):
     policy = {"min_auroc": 0.7, "min_ks": 0.1}
     res = validate_policy(perf, policy)
-    assert res["status"] == "FAIL"
-    assert any("AUROC" in r for r in res["reasons"])
-    assert any("KS" in r for r in res["reasons"])
+    assert res["status"] == expected
+    if not reason_substrs:
+        assert not res["reasons"]
+    for s in reason_substrs:
+        assert any(s in r for r in res["reasons"])
@@ -8,7 +8,7 @@ def test_shap_handles_missing_inputs():
 def test_shap_basic_array():
     import numpy as np
 
-    sv = np.array([[1.0, -2.0], [0.5, 0.0]])
+    sv = np.array([[1.0, -2.0], [0.5, 0.0]], dtype=np.float32)
     names = ["f1", "f2"]
     out = compute_top_features(sv, names, topk=2).features
     assert {f["name"] for f in out} == {"f1", "f2"}
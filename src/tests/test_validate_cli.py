@@ -1,33 +1,20 @@
-import json
-import pathlib
-import subprocess
-import sys
-import os
+from src.api.validate_cli import main as cli_main
+from src.ops import _jsonio
 
-ROOT = pathlib.Path(__file__).resolve().parents[2]
-PY = sys.executable
 
-
-def test_validate_cli_end_to_end(tmp_path):
-    reports = tmp_path / "reports"
-    reports.mkdir(parents=True, exist_ok=True)
-    (reports / "predictions.csv").write_text(
-        "y_true,y_pred_prob\n1,0.91\n0,0.12\n1,0.77\n0,0.05\n", encoding="utf-8"
-    )
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(ROOT)
+def test_validate_cli_end_to_end(sample_predictions_csv, monkeypatch):
+    # The CLI writes its artifacts next to the predictions file.
+    reports = sample_predictions_csv.parent
     # force stable path (no external argparse modules)
-    env["DRIFTOPS_ENABLE_EXTERNAL"] = "0"
+    monkeypatch.setenv("DRIFTOPS_ENABLE_EXTERNAL", "0")
 
-    cmd = [
-        PY,
-        str(ROOT / "src" / "api" / "validate_cli.py"),
-        "--preds",
-        str(reports / "predictions.csv"),
-    ]
-    subprocess.check_call(cmd, cwd=ROOT, env=env)
+    # Run the CLI in-process; the subprocess version paid full interpreter
+    # startup per test just to reach the same main().
+    rc = cli_main(["--preds", str(sample_predictions_csv)])
+    assert rc == 0
 
-    lv = json.loads((reports / "live_validation.json").read_text(encoding="utf-8"))
+    # read_bytes + orjson-backed loads: one pass, no intermediate str decode.
+    lv = _jsonio.loads((reports / "live_validation.json").read_bytes())
     assert lv["status"] in {"PASS", "FAIL"}
     assert "performance" in lv and "gate" in lv
     assert (reports / "policy_gate_result.json").exists()